@@ -12,7 +12,8 @@ Display Specifications:
 SPI Configuration:
     - Mode 3 (CPOL=1, CPHA=1)
     - Bit Order: LSB-first (requires manual bit reversal)
-    - Default Speed: 500 kHz
+    - Default Speed: 4 MHz
+    - GRAM writes: background DMA when rp2.DMA is available
 
 Default Pinout (RP2040 Zero):
     - GP0: FIL_EN (Filament Enable, Active High)
@@ -22,20 +23,38 @@ Default Pinout (RP2040 Zero):
     - GP4: RST# (Reset, Active Low)
 """
 
-from machine import Pin, SPI
+from machine import Pin, SPI, mem32
+import micropython
 import time
 
+try:
+    from rp2 import DMA
+except ImportError:
+    # Firmware without rp2.DMA: GRAM writes fall back to blocking SPI
+    DMA = None
+
+
+# RP2040 SPI (PL022) registers and DMA request lines, indexed by SPI ID
+_SPI_BASE = (0x4003C000, 0x40040000)
+_SPI_DREQ_TX = (16, 18)
+_SSPDR = 0x008
+_SSPSR = 0x00C
+_SSPICR = 0x020
+_SSPDMACR = 0x024
+_SSPSR_RNE = 0x04
+_SSPSR_BSY = 0x10
+_SSPICR_RORIC = 0x01
+_SSPDMACR_TXDMAE = 0x02
+
 
 def _make_reverse_table():
-    """Generate bit reversal lookup table."""
-    table = []
+    """Generate bit reversal lookup table (parallel swap, one pass per byte)."""
+    table = bytearray(256)
     for i in range(256):
-        # Reverse bits manually
-        b = 0
-        for bit in range(8):
-            if i & (1 << bit):
-                b |= (1 << (7 - bit))
-        table.append(b)
+        b = ((i & 0xF0) >> 4) | ((i & 0x0F) << 4)
+        b = ((b & 0xCC) >> 2) | ((b & 0x33) << 2)
+        b = ((b & 0xAA) >> 1) | ((b & 0x55) << 1)
+        table[i] = b
     return bytes(table)
 
 
@@ -55,6 +74,24 @@ def _reverse_bytes(data):
     return bytes([_REVERSE_BITS[b] for b in data])
 
 
+@micropython.viper
+def _reverse_buf_inplace(buf: ptr8, n: int):
+    """Reverse bits in the first n bytes of buf (parallel swap, no table)."""
+    for i in range(n):
+        b = int(buf[i])
+        b = ((b & 0xF0) >> 4) | ((b & 0x0F) << 4)
+        b = ((b & 0xCC) >> 2) | ((b & 0x33) << 2)
+        b = ((b & 0xAA) >> 1) | ((b & 0x55) << 1)
+        buf[i] = b & 0xFF
+
+
+@micropython.viper
+def _fill_buf(buf: ptr8, n: int, value: int):
+    """Set the first n bytes of buf to value."""
+    for i in range(n):
+        buf[i] = value
+
+
 class GP1294AI:
     """Low-level driver for GP1294AI VFD controller."""
     
@@ -70,6 +107,15 @@ class GP1294AI:
     CMD_EXIT_STANDBY = 0x6D
     CMD_ENTER_STANDBY = 0x61
     
+    # Fixed command sequences, pre-reversed for LSB-first transmission
+    _SEQ_RESET = _reverse_bytes(bytes([CMD_RESET]))
+    _SEQ_FRAME_SYNC = _reverse_bytes(bytes([CMD_FRAME_SYNC]))
+    _SEQ_VFD_MODE = _reverse_bytes(
+        bytes([CMD_VFD_MODE, 0x01, 0x1F, 0x00, 0xFF, 0x3F, 0x00, 0x20]))
+    _SEQ_OSC_SETTING = _reverse_bytes(bytes([CMD_OSC_SETTING, 0x08]))
+    _SEQ_EXIT_STANDBY = _reverse_bytes(bytes([CMD_EXIT_STANDBY]))
+    _SEQ_ENTER_STANDBY = _reverse_bytes(bytes([CMD_ENTER_STANDBY]))
+    
     # Display dimensions
     # GRAM: 512 columns × 8 bytes/column (64 vertical pixels, bytes 0-5 visible)
     # Physical: 256 × 48 visible pixels (2 GRAM columns = 1 physical pixel)
@@ -90,7 +136,7 @@ class GP1294AI:
     DEFAULT_BRIGHTNESS = 0x0028
     
     def __init__(self, spi_id=0, sck_pin=2, mosi_pin=3, cs_pin=1, 
-                 rst_pin=4, fil_en_pin=0, baudrate=500000):
+                 rst_pin=4, fil_en_pin=0, baudrate=4000000):
         """
         Initialize the GP1294AI VFD driver.
         
@@ -101,7 +147,7 @@ class GP1294AI:
             cs_pin: GPIO pin for chip select
             rst_pin: GPIO pin for hardware reset
             fil_en_pin: GPIO pin for filament enable
-            baudrate: SPI clock speed (default 500kHz)
+            baudrate: SPI clock speed (default 4MHz)
         """
         # Initialize control pins
         self.cs = Pin(cs_pin, Pin.OUT, value=1)  # CS high (inactive)
@@ -122,11 +168,50 @@ class GP1294AI:
             miso=None
         )
         
+        # GRAM transfer buffers: write-GRAM header + 4096 data bytes each,
+        # kept bit-reversed so a whole frame goes out in one SPI write.
+        # With DMA two buffers alternate: one drains to the SPI in the
+        # background while the next frame is rendered into the other.
+        self._dma = DMA() if DMA is not None else None
+        self._dma_busy = False
+        # Completion IRQs are matched to transfers by count: the n-th IRQ
+        # belongs to the n-th transfer, so a stale one can be told apart
+        self._dma_tx_seq = 0
+        self._dma_irq_seq = 0
+        self._spi_base = _SPI_BASE[spi_id]
+        if self._dma is not None:
+            self._dma_ctrl = self._dma.pack_ctrl(
+                size=0, inc_write=False, irq_quiet=False,
+                treq_sel=_SPI_DREQ_TX[spi_id])
+            self._dma.irq(self._on_dma_done)
+            mem32[self._spi_base + _SSPDMACR] |= _SSPDMACR_TXDMAE
+        
+        self._reversed_header_template = _reverse_bytes(
+            bytes([self.CMD_WRITE_GRAM, 0, 0]))
+        self._tx_bufs = []
+        for _ in range(1 if self._dma is None else 2):
+            buf = bytearray(3 + self.GRAM_SIZE)
+            buf[0:3] = self._reversed_header_template
+            self._tx_bufs.append(buf)
+        self._select_tx_buf(0)
+        
+        # Brightness command, pre-reversed; only the value bytes change
+        self._brightness_seq = bytearray(
+            _reverse_bytes(bytes([self.CMD_BRIGHTNESS, 0, 0])))
+        
         self._brightness = self.DEFAULT_BRIGHTNESS
         self._initialized = False
     
+    def _select_tx_buf(self, index):
+        """Make the given transfer buffer the one rendered into next."""
+        self._tx_index = index
+        self._tx_buf = self._tx_bufs[index]
+        self._tx_mv = memoryview(self._tx_buf)
+        self._gram = self._tx_mv[3:]
+    
     def _cs_low(self):
-        """Assert chip select (active low)."""
+        """Assert chip select (active low), after any background transfer."""
+        self.wait_transfer()
         self.cs.value(0)
     
     def _cs_high(self):
@@ -147,10 +232,17 @@ class GP1294AI:
             data = bytes(data)
         
         # Reverse bits for LSB-first transmission
-        reversed_data = _reverse_bytes(data)
+        self._write_seq(_reverse_bytes(data))
+    
+    def _write_seq(self, seq):
+        """
+        Write an already bit-reversed command sequence to the display.
         
+        Args:
+            seq: bytes to send as-is
+        """
         self._cs_low()
-        self.spi.write(reversed_data)
+        self.spi.write(seq)
         self._cs_high()
     
     def hardware_reset(self):
@@ -162,7 +254,7 @@ class GP1294AI:
     
     def software_reset(self):
         """Send software reset command."""
-        self._write_cmd([self.CMD_RESET])
+        self._write_seq(self._SEQ_RESET)
         time.sleep_ms(50)
     
     def filament_on(self):
@@ -181,12 +273,10 @@ class GP1294AI:
             brightness: 16-bit brightness value (0x0000 - 0x00FF typical range)
         """
         self._brightness = brightness & 0xFFFF
-        cmd = [
-            self.CMD_BRIGHTNESS,
-            self._brightness & 0xFF,
-            (self._brightness >> 8) & 0xFF
-        ]
-        self._write_cmd(cmd)
+        seq = self._brightness_seq
+        seq[1] = _REVERSE_BITS[self._brightness & 0xFF]
+        seq[2] = _REVERSE_BITS[(self._brightness >> 8) & 0xFF]
+        self._write_seq(seq)
     
     def set_display_offset(self, x_offset=0, y_offset=0x38):
         """
@@ -210,20 +300,19 @@ class GP1294AI:
     
     def set_vfd_mode(self):
         """Configure VFD mode settings."""
-        cmd = [self.CMD_VFD_MODE, 0x01, 0x1F, 0x00, 0xFF, 0x3F, 0x00, 0x20]
-        self._write_cmd(cmd)
+        self._write_seq(self._SEQ_VFD_MODE)
     
     def set_oscillator(self):
         """Configure oscillator settings."""
-        self._write_cmd([self.CMD_OSC_SETTING, 0x08])
+        self._write_seq(self._SEQ_OSC_SETTING)
     
     def enter_standby(self):
         """Enter standby/power-saving mode."""
-        self._write_cmd([self.CMD_ENTER_STANDBY])
+        self._write_seq(self._SEQ_ENTER_STANDBY)
     
     def exit_standby(self):
         """Exit standby mode."""
-        self._write_cmd([self.CMD_EXIT_STANDBY])
+        self._write_seq(self._SEQ_EXIT_STANDBY)
     
     def init(self):
         """
@@ -244,6 +333,7 @@ class GP1294AI:
         
         # Clear display (with trigger fix applied)
         self._apply_trigger_and_clear()
+        self.wait_transfer()
         time.sleep_ms(20)
         
         # Set display offset (Y=0x38 shifts display UP by 8 pixels)
@@ -273,9 +363,12 @@ class GP1294AI:
     
     def _apply_trigger_and_clear(self):
         """Clear the display with trigger fix applied."""
-        buffer = bytearray(self.GRAM_SIZE)
-        self._apply_trigger(buffer)
-        self.write_gram(buffer)
+        # 0x00 and 0xFF are unchanged by bit reversal, so the transfer
+        # buffer is filled directly and sent without a reversal pass
+        gram = self._gram
+        _fill_buf(gram, self.GRAM_SIZE, 0x00)
+        self._apply_trigger(gram)
+        self.write_gram(gram, _preformatted=True)
     
     def clear(self):
         """Clear the display (all pixels off, but trigger preserved)."""
@@ -283,10 +376,11 @@ class GP1294AI:
     
     def fill(self):
         """Fill the display (all pixels on)."""
-        full_frame = bytes([0xFF] * self.GRAM_SIZE)
-        self.write_gram(full_frame)
+        gram = self._gram
+        _fill_buf(gram, self.GRAM_SIZE, 0xFF)
+        self.write_gram(gram, _preformatted=True)
     
-    def write_gram(self, data, x_start=0, y_start=0):
+    def write_gram(self, data, x_start=0, y_start=0, _preformatted=False):
         """
         Write data to GRAM (Graphics RAM).
         
@@ -294,34 +388,140 @@ class GP1294AI:
             data: Pixel data bytes (1 bit per pixel, column-major order)
             x_start: Starting X position  
             y_start: Starting Y position (in pixel rows)
-        """
-        # Build command header (no height parameter needed)
-        header = bytes([self.CMD_WRITE_GRAM, x_start, y_start])
+            _preformatted: True if data is already bit-reversed
+                (e.g. rendered directly into gram_buffer)
         
-        # Ensure data is bytes
-        if isinstance(data, (list, bytearray)):
+        Raises:
+            ValueError: If data is longer than GRAM_SIZE bytes, or
+                x_start/y_start is outside 0-255
+        """
+        if isinstance(data, list):
             data = bytes(data)
         
-        # Reverse bits for LSB-first transmission
-        reversed_header = _reverse_bytes(header)
-        reversed_data = _reverse_bytes(data)
+        n = len(data)
+        if n > self.GRAM_SIZE:
+            raise ValueError(
+                "GRAM data too long: %d bytes (max %d)" % (n, self.GRAM_SIZE))
+        
+        # Stage data in the transfer buffer unless it was rendered there
+        gram = self._gram
+        if data is not gram:
+            gram[:n] = data
+        
+        # Reverse bits in place for LSB-first transmission
+        if not _preformatted:
+            _reverse_buf_inplace(gram, n)
+        
+        self.write_gram_preformatted(n, x_start, y_start)
+    
+    def write_gram_preformatted(self, length=GRAM_SIZE, x_start=0, y_start=0):
+        """
+        Send header + GRAM buffer in a single SPI transaction.
+        
+        The data region (gram_buffer) must already hold bit-reversed,
+        column-major GRAM bytes.
+        
+        Args:
+            length: Number of data bytes to send (default: full GRAM)
+            x_start: Starting X position
+            y_start: Starting Y position (in pixel rows)
+        
+        Raises:
+            ValueError: If x_start or y_start is outside 0-255
+        """
+        if not (0 <= x_start <= 255 and 0 <= y_start <= 255):
+            raise ValueError(
+                "GRAM start out of range: x=%d, y=%d (max 255)"
+                % (x_start, y_start))
+        
+        # Command byte is cached in the buffer; only refresh the position
+        tx = self._tx_buf
+        tx[1] = _REVERSE_BITS[x_start]
+        tx[2] = _REVERSE_BITS[y_start]
         
-        # Send header + data
         self._cs_low()
-        self.spi.write(reversed_header)
-        self.spi.write(reversed_data)
+        if self._dma is None:
+            self.spi.write(self._tx_mv[:3 + length])
+            self._cs_high()
+            return
+        
+        # Let DMA feed the SPI TX FIFO and return immediately; CS is
+        # released by the completion IRQ (or an earlier wait_transfer())
+        self._dma_tx_seq += 1
+        self._dma_busy = True
+        self._dma.config(
+            read=tx,
+            write=self._spi_base + _SSPDR,
+            count=3 + length,
+            ctrl=self._dma_ctrl,
+            trigger=True
+        )
+        
+        # Render the next frame into the other buffer
+        self._select_tx_buf(self._tx_index ^ 1)
+    
+    def _on_dma_done(self, dma):
+        """DMA completion IRQ (soft): end the write-GRAM transaction."""
+        self._dma_irq_seq += 1
+        # Only the IRQ of the latest transfer may close it; an older one
+        # (already handled by wait_transfer()) can run while the next
+        # transfer is being set up and must not raise CS
+        if self._dma_irq_seq == self._dma_tx_seq:
+            self.wait_transfer()
+    
+    def wait_transfer(self):
+        """
+        Block until a background GRAM transfer (if any) has finished
+        and chip select is released.
+        """
+        if not self._dma_busy:
+            return
+        
+        while self._dma.active():
+            pass
+        
+        # DMA done only means the FIFO is fed; wait for the last byte
+        base = self._spi_base
+        while mem32[base + _SSPSR] & _SSPSR_BSY:
+            pass
+        
+        # TX-only transfer: discard what was clocked into the RX FIFO
+        while mem32[base + _SSPSR] & _SSPSR_RNE:
+            mem32[base + _SSPDR]
+        mem32[base + _SSPICR] = _SSPICR_RORIC
+        
+        self._dma_busy = False
         self._cs_high()
     
     def frame_sync(self):
         """Send frame sync command."""
-        self._write_cmd([self.CMD_FRAME_SYNC])
+        self._write_seq(self._SEQ_FRAME_SYNC)
     
     def deinit(self):
         """Deinitialize the display and turn off filament."""
         self.filament_off()
         self.enter_standby()
+        
+        # Release the DMA channel (the IRQ handler would keep it alive);
+        # later GRAM writes fall back to blocking SPI
+        if self._dma is not None:
+            self.wait_transfer()
+            self._dma.irq(None)
+            self._dma.close()
+            self._dma = None
+        
         self._initialized = False
     
+    @property
+    def gram_buffer(self):
+        """
+        Get the GRAM data region of the transfer buffer (bit-reversed).
+        
+        With DMA the buffer alternates after every GRAM write, so fetch
+        it again for each frame instead of keeping a reference.
+        """
+        return self._gram
+    
     @property
     def is_initialized(self):
         """Check if display is initialized."""
@@ -8,9 +8,36 @@ Run this file directly to start the demo loop.
 """
 
 from vfd_framebuffer import VFDFramebuffer
+import framebuf
 import time
 
 
+# Static test patterns, rendered on first use by _get_patterns()
+_patterns = None
+
+
+def _get_patterns():
+    """
+    Return the (checkerboard, stripes) MONO_VLSB framebuffers (256x48),
+    rendering them on the first call.
+    """
+    global _patterns
+    if _patterns is None:
+        # Checkerboard of 8x8 squares
+        checker = framebuf.FrameBuffer(bytearray(256 * 6), 256, 48,
+                                       framebuf.MONO_VLSB)
+        for y in range(0, 48, 8):
+            for x in range((y // 8) % 2 * 8, 256, 16):
+                checker.fill_rect(x, y, 8, 8, 1)
+        # Vertical stripes: 2 pixels on, 6 pixels off
+        stripes = framebuf.FrameBuffer(bytearray(256 * 6), 256, 48,
+                                       framebuf.MONO_VLSB)
+        for x in range(0, 256, 8):
+            stripes.fill_rect(x, 0, 2, 48, 1)
+        _patterns = (checker, stripes)
+    return _patterns
+
+
 def demo_text(vfd):
     """Demonstrate text rendering."""
     vfd.fill(0)
@@ -121,12 +148,16 @@ def demo_brightness(vfd):
     vfd.center_text("Brightness", 10)
     vfd.show()
     
+    # Only the level text changes, so only its columns are sent
+    text_w = len("Level: 000") * 8
+    text_x = (256 - text_w) // 2
+    
     # Fade out
     for b in range(40, 0, -1):
         vfd.set_brightness(b)
         vfd.fill_rect(0, 30, 256, 8, 0)  # Clear text area
         vfd.center_text(f"Level: {b:3d}", 30)
-        vfd.show()
+        vfd.show_rect(text_x, 30, text_w, 8)
         time.sleep_ms(50)
     
     # Fade in
@@ -134,7 +165,7 @@ def demo_brightness(vfd):
         vfd.set_brightness(b)
         vfd.fill_rect(0, 30, 256, 8, 0)  # Clear text area
         vfd.center_text(f"Level: {b:3d}", 30)
-        vfd.show()
+        vfd.show_rect(text_x, 30, text_w, 8)
         time.sleep_ms(50)
     
     time.sleep(1)
@@ -147,17 +178,25 @@ def demo_animation(vfd):
     dx, dy = 4, 3
     radius = 6
     
+    # Draw the static background once
+    vfd.fill(0)
+    
+    # Draw border around full screen
+    vfd.rect(0, 0, 256, 48, 1)
+    
+    # Draw corner markers
+    vfd.fill_rect(2, 2, 4, 4, 1)
+    vfd.fill_rect(250, 2, 4, 4, 1)
+    vfd.fill_rect(2, 42, 4, 4, 1)
+    vfd.fill_rect(250, 42, 4, 4, 1)
+    
+    background = bytes(vfd.buffer)
+    vfd.show()
+    prev_x = x
+    
     for frame in range(200):
-        vfd.fill(0)
-        
-        # Draw border around full screen
-        vfd.rect(0, 0, 256, 48, 1)
-        
-        # Draw corner markers
-        vfd.fill_rect(2, 2, 4, 4, 1)
-        vfd.fill_rect(250, 2, 4, 4, 1)
-        vfd.fill_rect(2, 42, 4, 4, 1)
-        vfd.fill_rect(250, 42, 4, 4, 1)
+        # Restore background (also erases the previous ball)
+        vfd.buffer[:] = background
         
         # Draw ball
         vfd.fill_circle(int(x), int(y), radius, 1)
@@ -165,6 +204,12 @@ def demo_animation(vfd):
         # Draw frame counter on right side
         vfd.text(f"{frame:03d}", 210, 20, 1)
         
+        # Send only what changed: old + new ball columns and the counter
+        left = min(prev_x, x) - radius
+        vfd.show_rect(left, 0, abs(x - prev_x) + 2 * radius + 1, 48)
+        vfd.show_rect(210, 20, 24, 8)
+        prev_x = x
+        
         # Update position
         x += dx
         y += dy
@@ -175,7 +220,6 @@ def demo_animation(vfd):
         if y <= radius + 2 or y >= 46 - radius:
             dy = -dy
         
-        vfd.show()
         time.sleep_ms(25)
 
 
@@ -195,21 +239,15 @@ def demo_pattern(vfd):
     vfd.show()
     time.sleep(2)
     
+    checker, stripes = _get_patterns()
+    
     # Draw checkerboard pattern across full width
-    vfd.fill(0)
-    for y in range(0, 48, 8):
-        for x in range(0, 256, 8):
-            if (x // 8 + y // 8) % 2 == 0:
-                vfd.fill_rect(x, y, 8, 8, 1)
+    vfd.blit(checker, 0, 0)
     vfd.show()
     time.sleep(2)
     
     # Draw vertical stripes across full width
-    vfd.fill(0)
-    for x in range(0, 256, 4):
-        if (x // 4) % 2 == 0:
-            vfd.vline(x, 0, 48, 1)
-            vfd.vline(x + 1, 0, 48, 1)
+    vfd.blit(stripes, 0, 0)
     vfd.show()
     time.sleep(2)
     
@@ -235,7 +273,7 @@ def run_demo():
         cs_pin=1,
         rst_pin=4,
         fil_en_pin=0,
-        baudrate=500000
+        baudrate=4000000
     )
     
     # Initialize display
@@ -19,7 +19,75 @@ Usage:
 """
 
 import framebuf
-from gp1294ai import GP1294AI
+import micropython
+import uctypes
+from gp1294ai import GP1294AI, _REVERSE_BITS
+
+
+@micropython.viper
+def _transpose_vlsb_to_gram(src: ptr8, dst: ptr8, x0: int, x1: int):
+    """
+    Convert columns x0..x1-1 of a 256x48 MONO_VLSB buffer to bit-reversed
+    GRAM layout, starting at the beginning of dst.
+    
+    Each physical column becomes 2 identical GRAM columns of 8 bytes
+    (16 bytes per physical column). Off-screen bytes 6-7 are zeroed, as
+    the shared transfer buffer may hold other data there (e.g. after
+    GP1294AI.fill()).
+    """
+    reverse_tab = ptr8(_REVERSE_BITS)
+    # Fixed shape (6 source rows of 256 bytes, 8-byte GRAM stride),
+    # so the per-row loop is unrolled
+    for x in range(x0, x1):
+        col0 = (x - x0) << 4
+        b = int(reverse_tab[src[x]])
+        dst[col0] = b
+        dst[col0 + 8] = b
+        b = int(reverse_tab[src[256 + x]])
+        dst[col0 + 1] = b
+        dst[col0 + 9] = b
+        b = int(reverse_tab[src[512 + x]])
+        dst[col0 + 2] = b
+        dst[col0 + 10] = b
+        b = int(reverse_tab[src[768 + x]])
+        dst[col0 + 3] = b
+        dst[col0 + 11] = b
+        b = int(reverse_tab[src[1024 + x]])
+        dst[col0 + 4] = b
+        dst[col0 + 12] = b
+        b = int(reverse_tab[src[1280 + x]])
+        dst[col0 + 5] = b
+        dst[col0 + 13] = b
+        dst[col0 + 6] = 0
+        dst[col0 + 7] = 0
+        dst[col0 + 14] = 0
+        dst[col0 + 15] = 0
+
+
+# Blit palette mapping source color 0 -> 1 and 1 -> 0
+_INVERT_PALETTE = framebuf.FrameBuffer(bytearray(2), 2, 1, framebuf.MONO_VLSB)
+_INVERT_PALETTE.pixel(0, 0, 1)
+
+
+@micropython.viper
+def _invert_buf(buf: ptr32, n_words: int):
+    """Invert n_words 32-bit words of buf in place."""
+    i = 0
+    while i < n_words:
+        buf[i] = buf[i] ^ -1  # all ones; 0xFFFFFFFF is not a viper int
+        i += 1
+
+
+@micropython.viper
+def _set_pixel(buf: ptr8, x: int, y: int, c: int):
+    """Set or clear pixel (x, y) of a 256x48 MONO_VLSB buffer (clipped)."""
+    if x < 0 or x >= 256 or y < 0 or y >= 48:
+        return
+    i = (y >> 3) * 256 + x
+    if c:
+        buf[i] = buf[i] | (1 << (y & 7))
+    else:
+        buf[i] = buf[i] & (0xFF ^ (1 << (y & 7)))
 
 
 class VFDFramebuffer(framebuf.FrameBuffer):
@@ -53,7 +121,7 @@ class VFDFramebuffer(framebuf.FrameBuffer):
     VISIBLE_HEIGHT = HEIGHT
     
     def __init__(self, spi_id=0, sck_pin=2, mosi_pin=3, cs_pin=1,
-                 rst_pin=4, fil_en_pin=0, baudrate=500000):
+                 rst_pin=4, fil_en_pin=0, baudrate=4000000):
         """
         Initialize VFD Framebuffer.
         
@@ -88,6 +156,13 @@ class VFDFramebuffer(framebuf.FrameBuffer):
         # show() expands to GRAM (2 GRAM columns per physical pixel)
         super().__init__(self._buffer, self.WIDTH, self.HEIGHT, framebuf.MONO_VLSB)
         
+        # Zero-copy 32-bit word view of the same memory (384 words)
+        self._buffer32 = uctypes.struct(
+            uctypes.addressof(self._buffer),
+            {"words": (uctypes.ARRAY | 0, uctypes.UINT32 | (len(self._buffer) // 4))},
+            uctypes.LITTLE_ENDIAN
+        ).words
+        
         self._auto_show = False
     
     def init(self):
@@ -98,9 +173,13 @@ class VFDFramebuffer(framebuf.FrameBuffer):
     def _apply_trigger(self, buffer):
         """
         Apply display trigger pattern to GRAM buffer.
-        Only GRAM column 0, byte 0 needed (minimizes visible artifact).
+        
+        Same pattern as GP1294AI._apply_trigger: only GRAM column 0,
+        byte 0 is set. Column 1 is left as rendered, which minimizes
+        the visible artifact. 0xFF is unchanged by bit reversal, so this
+        also works on the pre-reversed transfer buffer.
         """
-        buffer[0 * self.GRAM_STRIDE + 0] = 0xFF
+        buffer[0] = 0xFF  # GRAM column 0, byte 0
     
     def show(self):
         """
@@ -109,24 +188,54 @@ class VFDFramebuffer(framebuf.FrameBuffer):
         Converts the physical framebuffer (256x48) to GRAM format (512x64):
         - Expands each physical column to 2 GRAM columns
         - Transposes from row-major to column-major layout
+        - Reverses bit order for LSB-first transmission
+        
+        The result is written straight into the driver's transfer buffer.
+        With DMA available this returns while the transfer is still
+        running, so the next frame can be drawn in the meantime.
+        """
+        gram = self._display.gram_buffer
+        _transpose_vlsb_to_gram(self._buffer, gram, 0, self.WIDTH)
+        self._apply_trigger(gram)
+        self._display.write_gram(gram, _preformatted=True)
+    
+    def show_rect(self, x, y, w, h):
         """
-        vfd_buffer = bytearray(self.GRAM_WIDTH * self.GRAM_STRIDE)
+        Transfer only part of the framebuffer to the display.
         
-        for phys_x in range(self.WIDTH):
-            gram_col0 = phys_x * 2
-            gram_col1 = phys_x * 2 + 1
-            
-            for y_byte in range(self.HEIGHT // 8):
-                src_idx = y_byte * self.WIDTH + phys_x
-                byte_val = self._buffer[src_idx]
-                
-                dst_idx0 = gram_col0 * self.GRAM_STRIDE + y_byte
-                dst_idx1 = gram_col1 * self.GRAM_STRIDE + y_byte
-                vfd_buffer[dst_idx0] = byte_val
-                vfd_buffer[dst_idx1] = byte_val
+        GRAM is written in whole columns, so columns x..x+w-1 are sent at
+        full height; y and h only matter for skipping empty regions.
         
-        self._apply_trigger(vfd_buffer)
-        self._display.write_gram(vfd_buffer)
+        Args:
+            x: X position of the changed region
+            y: Y position of the changed region
+            w: Width of the changed region
+            h: Height of the changed region
+        """
+        x0 = max(0, x)
+        x1 = min(self.WIDTH, x + w)
+        if x1 <= x0 or h <= 0 or y >= self.HEIGHT or y + h <= 0:
+            return
+        
+        # The write-GRAM header addresses GRAM columns with a single byte,
+        # so a partial write cannot start past physical column 127
+        x0 = min(x0, 127)
+        
+        gram = self._display.gram_buffer
+        _transpose_vlsb_to_gram(self._buffer, gram, x0, x1)
+        if x0 == 0:
+            self._apply_trigger(gram)
+        self._display.write_gram_preformatted(
+            (x1 - x0) * 2 * self.GRAM_STRIDE, x_start=x0 * 2)
+    
+    def wait_transfer(self):
+        """
+        Block until the last show()/show_rect() transfer has finished.
+        
+        Only needed with DMA, e.g. before timing-sensitive code that
+        expects the frame to be fully on the display.
+        """
+        self._display.wait_transfer()
     
     def clear(self):
         """Clear the framebuffer and update display."""
@@ -178,8 +287,8 @@ class VFDFramebuffer(framebuf.FrameBuffer):
     
     def invert(self):
         """Invert all pixels in the framebuffer."""
-        for i in range(len(self._buffer)):
-            self._buffer[i] ^= 0xFF
+        # 1536 bytes = 384 words, XORed 4 bytes at a time
+        _invert_buf(self._buffer, len(self._buffer) // 4)
     
     def draw_bitmap(self, x, y, bitmap, width, height, color=1):
         """
@@ -188,22 +297,43 @@ class VFDFramebuffer(framebuf.FrameBuffer):
         Args:
             x: X position
             y: Y position
-            bitmap: Bitmap data (bytes, 1 bit per pixel)
+            bitmap: Bitmap data (bytes or list, 1 bit per pixel,
+                rows MSB-first)
             width: Bitmap width in pixels
             height: Bitmap height in pixels
             color: 1 for on, 0 for off
+        
+        If bitmap holds fewer than height rows, the pixels it does cover
+        (including a trailing partial row) are drawn; the rest of the area
+        is left untouched.
         """
+        # Rows are MSB-first and byte-aligned, i.e. framebuf's MONO_HMSB
+        if width <= 0 or height <= 0:
+            return
         byte_width = (width + 7) // 8
-        for row in range(height):
-            for col in range(width):
-                byte_idx = row * byte_width + col // 8
-                bit_idx = 7 - (col % 8)  # MSB first in bitmap
-                if byte_idx < len(bitmap):
-                    if (bitmap[byte_idx] >> bit_idx) & 1:
-                        self.pixel(x + col, y + row, color)
-                    else:
-                        self.pixel(x + col, y + row, 1 - color)
+        n = len(bitmap)
+        rows = min(height, n // byte_width)
+        # Opaque copy; for color 0 the palette swaps set and clear bits
+        palette = None if color else _INVERT_PALETTE
+        
+        if rows > 0:
+            if isinstance(bitmap, bytearray):
+                buf = bitmap
+            else:
+                # FrameBuffer needs a writable buffer
+                buf = bytearray(bitmap[:byte_width * rows])
+            src = framebuf.FrameBuffer(buf, width, rows, framebuf.MONO_HMSB)
+            self.blit(src, x, y, -1, palette)
+        
+        # Trailing partial row: draw only the columns its bytes cover
+        start = rows * byte_width
+        if rows < height and start < n:
+            buf = bytearray(bitmap[start:n])
+            src = framebuf.FrameBuffer(buf, min(width, len(buf) * 8), 1,
+                                       framebuf.MONO_HMSB)
+            self.blit(src, x, y + rows, -1, palette)
     
+    @micropython.native
     def draw_circle(self, cx, cy, r, color=1):
         """
         Draw a circle outline using Bresenham's algorithm.
@@ -214,19 +344,21 @@ class VFDFramebuffer(framebuf.FrameBuffer):
             r: Radius
             color: 1 for on, 0 for off
         """
+        buf = self._buffer
         x = r
         y = 0
         err = 0
         
         while x >= y:
-            self.pixel(cx + x, cy + y, color)
-            self.pixel(cx + y, cy + x, color)
-            self.pixel(cx - y, cy + x, color)
-            self.pixel(cx - x, cy + y, color)
-            self.pixel(cx - x, cy - y, color)
-            self.pixel(cx - y, cy - x, color)
-            self.pixel(cx + y, cy - x, color)
-            self.pixel(cx + x, cy - y, color)
+            # Write the 8 octant points straight into the buffer
+            _set_pixel(buf, cx + x, cy + y, color)
+            _set_pixel(buf, cx + y, cy + x, color)
+            _set_pixel(buf, cx - y, cy + x, color)
+            _set_pixel(buf, cx - x, cy + y, color)
+            _set_pixel(buf, cx - x, cy - y, color)
+            _set_pixel(buf, cx - y, cy - x, color)
+            _set_pixel(buf, cx + y, cy - x, color)
+            _set_pixel(buf, cx + x, cy - y, color)
             
             y += 1
             err += 1 + 2 * y
@@ -234,6 +366,7 @@ class VFDFramebuffer(framebuf.FrameBuffer):
                 x -= 1
                 err += 1 - 2 * x
     
+    @micropython.native
     def fill_circle(self, cx, cy, r, color=1):
         """
         Draw a filled circle.
@@ -244,10 +377,16 @@ class VFDFramebuffer(framebuf.FrameBuffer):
             r: Radius
             color: 1 for on, 0 for off
         """
-        for y in range(-r, r + 1):
-            for x in range(-r, r + 1):
-                if x * x + y * y <= r * r:
-                    self.pixel(cx + x, cy + y, color)
+        # One horizontal span per row; the half-width only ever shrinks
+        # moving away from the center, so it is tracked with integer math
+        r2 = r * r
+        dx = r
+        for dy in range(r + 1):
+            while dx * dx + dy * dy > r2:
+                dx -= 1
+            self.hline(cx - dx, cy + dy, 2 * dx + 1, color)
+            if dy:
+                self.hline(cx - dx, cy - dy, 2 * dx + 1, color)
     
     def draw_progress_bar(self, x, y, width, height, progress, color=1):
         """
@@ -292,6 +431,16 @@ class VFDFramebuffer(framebuf.FrameBuffer):
         """Get direct access to the framebuffer memory."""
         return self._buffer
     
+    @property
+    def buffer32(self):
+        """
+        Get the framebuffer memory as an array of 32-bit words.
+        
+        Shares memory with buffer (no copy); useful for bulk edits
+        that touch 4 bytes (4 columns of 8 pixels) per access.
+        """
+        return self._buffer32
+    
     @property
     def display(self):
         """Get access to the underlying GP1294AI driver."""